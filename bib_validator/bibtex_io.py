@@ -1,12 +1,27 @@
 """BibTeX file I/O operations"""
 
 import bibtexparser
-import bibtexparser.bibdatabase
-from typing import List, Dict
+from typing import Dict, Iterable, List
+
+# bibtexparser v2 (much faster parser on large files) exposes
+# parse_file/write_file at the top level; v1 does not
+_HAS_V2 = hasattr(bibtexparser, "parse_file")
+
+
+def _entry_to_dict(entry) -> Dict:
+    """Convert a bibtexparser v2 Entry to the flat dict shape v1 produces"""
+    fields = {name.lower(): field.value for name, field in entry.fields_dict.items()}
+    fields["ID"] = entry.key
+    fields["ENTRYTYPE"] = entry.entry_type
+    return fields
 
 
 def load_bibtex_entries(path: str) -> List[Dict]:
     """Load entries from a BibTeX file"""
+    if _HAS_V2:
+        library = bibtexparser.parse_file(path)
+        return [_entry_to_dict(entry) for entry in library.entries]
+
     with open(path, "r", encoding="utf-8") as bibfile:
         parser = bibtexparser.bparser.BibTexParser(common_strings=True)
         parser.ignore_nonstandard_types = False
@@ -15,10 +30,28 @@ def load_bibtex_entries(path: str) -> List[Dict]:
         return bib_database.entries
 
 
-def write_bibtex_entries(path: str, entries: List[Dict]) -> None:
-    """Write entries to a BibTeX file"""
+def write_bibtex_entries(path: str, entries: Iterable[Dict]) -> None:
+    """Write entries (any iterable, e.g. iter_corrected_entries) to a BibTeX file"""
+    if _HAS_V2:
+        from bibtexparser.model import Entry, Field
+
+        library = bibtexparser.Library()
+        for entry in entries:
+            fields = [
+                Field(key, value)
+                for key, value in entry.items()
+                if key not in ("ID", "ENTRYTYPE")
+            ]
+            library.add(
+                Entry(entry.get("ENTRYTYPE", "misc"), entry.get("ID", ""), fields)
+            )
+        bibtexparser.write_file(path, library)
+        return
+
+    import bibtexparser.bibdatabase
+
     db = bibtexparser.bibdatabase.BibDatabase()
-    db.entries = entries
-    
+    db.entries = list(entries)
+
     with open(path, "w", encoding="utf-8") as bibfile:
         bibtexparser.dump(db, bibfile)
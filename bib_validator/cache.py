@@ -0,0 +1,201 @@
+"""Persistent on-disk cache for source lookups"""
+
+import functools
+import hashlib
+import logging
+import os
+import pickle
+import sqlite3
+import time
+from typing import Any, Callable, Optional
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "bib_validator", "lookups.sqlite3"
+)
+
+# Cached lookups are reused for 30 days before hitting the network again
+DEFAULT_TTL = 30 * 24 * 3600
+
+# Misses are cached too, but only for a day: a paper absent from a source
+# today may be indexed tomorrow, while a found record rarely changes
+NEGATIVE_TTL = 24 * 3600
+
+
+class LookupCache:
+    """SQLite-backed cache of (source, query_kind, query_value) -> result"""
+
+    #: Sentinel distinguishing "no usable cache entry" from a cached None
+    MISS = object()
+
+    def __init__(
+        self,
+        path: str = DEFAULT_CACHE_PATH,
+        ttl: int = DEFAULT_TTL,
+        negative_ttl: int = NEGATIVE_TTL,
+    ):
+        """
+        Open (creating if needed) the cache database.
+
+        Args:
+            path: Path to the SQLite database file
+            ttl: Time-to-live for cached positive results, in seconds
+            negative_ttl: Time-to-live for cached misses (None results)
+        """
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # isolation_level=None -> autocommit, check_same_thread=False so the
+        # cache can be shared once validation becomes multi-threaded
+        self._conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value BLOB, ts INTEGER)"
+        )
+        # HTTP cache validators recorded per URL so reachability checks can
+        # issue conditional requests on later runs
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS url_validators "
+            "(url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, ts INTEGER)"
+        )
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+
+    @staticmethod
+    def make_key(source: str, kind: str, query: str) -> str:
+        """Build a cache key from source name, query kind, and query value"""
+        digest = hashlib.blake2b(query.encode("utf-8"), digest_size=16).hexdigest()
+        return f"{source}:{kind}:{digest}"
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the cached value for key, or default on miss/expiry
+
+        Cached None values (negative results) expire after negative_ttl;
+        everything else after ttl. Pass default=LookupCache.MISS to tell a
+        cached miss apart from an absent entry.
+        """
+        row = self._conn.execute(
+            "SELECT value, ts FROM cache WHERE key=?", (key,)
+        ).fetchone()
+
+        if row is None:
+            return default
+
+        try:
+            value = pickle.loads(row[0])
+        except Exception:
+            logger.debug("Failed to unpickle cache entry %s", key, exc_info=True)
+            return default
+
+        ttl = self.ttl if value is not None else self.negative_ttl
+        if row[1] <= int(time.time()) - ttl:
+            return default
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value for key, replacing any previous entry"""
+        try:
+            blob = pickle.dumps(value)
+        except Exception:
+            # Some source results (e.g. live API objects) may not pickle; skip them
+            logger.debug("Failed to pickle cache entry %s", key, exc_info=True)
+            return
+
+        self._conn.execute(
+            "INSERT OR REPLACE INTO cache (key, value, ts) VALUES (?, ?, ?)",
+            (key, blob, int(time.time())),
+        )
+
+    def get_url_validators(self, url: str):
+        """Return (etag, last_modified) recorded for a URL, or (None, None)"""
+        row = self._conn.execute(
+            "SELECT etag, last_modified FROM url_validators WHERE url=? AND ts>?",
+            (url, int(time.time()) - self.ttl),
+        ).fetchone()
+        return (row[0], row[1]) if row is not None else (None, None)
+
+    def set_url_validators(self, url: str, etag: Optional[str], last_modified: Optional[str]) -> None:
+        """Record the cache validators a URL's server returned"""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO url_validators (url, etag, last_modified, ts) "
+            "VALUES (?, ?, ?, ?)",
+            (url, etag, last_modified, int(time.time())),
+        )
+
+    def clear(self) -> None:
+        """Drop all cached entries"""
+        self._conn.execute("DELETE FROM cache")
+        self._conn.execute("DELETE FROM url_validators")
+
+    def close(self) -> None:
+        """Close the underlying database connection"""
+        self._conn.close()
+
+
+_default_cache: Optional[LookupCache] = None
+_cache_disabled = False
+
+
+def get_cache() -> Optional[LookupCache]:
+    """Return the shared cache instance, creating it on first use"""
+    global _default_cache, _cache_disabled
+
+    if _cache_disabled:
+        return None
+
+    if _default_cache is None:
+        try:
+            _default_cache = LookupCache()
+        except Exception:
+            # Unwritable cache dir etc. -- run without caching rather than fail
+            logger.debug("Could not open lookup cache; caching disabled", exc_info=True)
+            _cache_disabled = True
+            return None
+
+    return _default_cache
+
+
+def refresh_cache() -> None:
+    """Invalidate all cached lookups (used by the --refresh-cache CLI flag)"""
+    cache = get_cache()
+    if cache is not None:
+        cache.clear()
+
+
+def cached(source: str, kind: str) -> Callable:
+    """
+    Decorator caching a source lookup method through the shared LookupCache.
+
+    The wrapped method must take the query value (DOI or title) as its first
+    positional argument. Positive results are stored for the cache's full
+    TTL; a None result is stored too (so reruns skip known misses) but only
+    for the short negative TTL.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(self, query, *args, **kwargs):
+            cache = get_cache()
+            limiter = getattr(self, "limiter", None)
+
+            if cache is None or not query:
+                if limiter is not None:
+                    limiter.acquire()
+                return func(self, query, *args, **kwargs)
+
+            key = LookupCache.make_key(source, kind, str(query))
+            hit = cache.get(key, default=LookupCache.MISS)
+            if hit is not LookupCache.MISS:
+                return hit
+
+            # Rate-limit only actual network calls; cache hits returned
+            # above never touch the source's token bucket
+            if limiter is not None:
+                limiter.acquire()
+
+            result = func(self, query, *args, **kwargs)
+            cache.set(key, result)
+            return result
+
+        return wrapper
+
+    return decorator
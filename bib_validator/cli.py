@@ -3,9 +3,11 @@
 import argparse
 import sys
 from .bibtex_io import load_bibtex_entries, write_bibtex_entries
+from .normalize import annotate_norm_titles
 from .validator import SmartBibtexValidator
 from .reporting import generate_report, print_summary
 from .sources import build_sources
+from .cache import refresh_cache
 
 
 def main():
@@ -36,9 +38,18 @@ def main():
         action="store_true",
         help="Skip URL reachability checks",
     )
+    parser.add_argument(
+        "--refresh-cache",
+        action="store_true",
+        help="Invalidate cached source lookups and re-query everything",
+    )
 
     args = parser.parse_args()
 
+    if args.refresh_cache:
+        refresh_cache()
+        print("✓ Lookup cache cleared")
+
     # Load entries
     print(f"📖 Parsing BibTeX file: {args.bibtex_file}")
     try:
@@ -48,6 +59,9 @@ def main():
         print(f"❌ Error parsing BibTeX file: {e}")
         sys.exit(1)
 
+    # Normalize titles before the network stage (multi-process on large files)
+    annotate_norm_titles(entries)
+
     # Build sources
     sources = build_sources(args.sources)
     if not sources:
@@ -58,9 +72,9 @@ def main():
     validator = SmartBibtexValidator(entries, sources)
     validator.validate_all(check_urls=not args.skip_url_check)
 
-    # Generate outputs
-    updated_entries = validator.apply_corrections_to_entries()
-    write_bibtex_entries(args.output_bib, updated_entries)
+    # Generate outputs; corrected entries are streamed straight into the
+    # writer instead of materializing a second entry list
+    write_bibtex_entries(args.output_bib, validator.iter_corrected_entries())
     print(f"✓ Updated BibTeX saved to {args.output_bib}")
 
     generate_report(entries, validator.results, args.sources, args.output_report)
@@ -0,0 +1,90 @@
+"""Shared title normalization for searching and cache keys"""
+
+import functools
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List
+
+try:
+    from unidecode import unidecode
+except ImportError:
+    unidecode = None
+
+
+_NON_WORD_RE = re.compile(r"\W+")
+
+# Below this many entries, process startup costs more than it saves
+MIN_PARALLEL_ENTRIES = 2000
+
+
+@functools.lru_cache(maxsize=4096)
+def norm_title(s: str) -> str:
+    """
+    Normalize a title once for use across all sources.
+
+    Transliterates to ASCII (when Unidecode is available), lowercases,
+    and collapses runs of non-word characters to single spaces. The result
+    is stable, so it doubles as a cache key that matches the same paper
+    across differently formatted titles.
+
+    Args:
+        s: Raw title string (may contain LaTeX braces, accents, punctuation)
+
+    Returns:
+        Normalized title string
+    """
+    if not s:
+        return ""
+
+    if unidecode is not None:
+        s = unidecode(s)
+
+    return _NON_WORD_RE.sub(" ", s.lower()).strip()
+
+
+def _norm_titles_chunk(titles: List[str]) -> List[str]:
+    """Normalize one chunk of titles (runs in a worker process)"""
+    return [norm_title(t) for t in titles]
+
+
+def annotate_norm_titles(entries: List[Dict]) -> List[Dict]:
+    """
+    Add a _norm_title annotation to every entry.
+
+    Normalization is pure CPU work, so for large bibliographies the titles
+    are split into one contiguous chunk per core and normalized in a
+    ProcessPoolExecutor; small inputs stay single-process since worker
+    startup would cost more than it saves. Entries already annotated are
+    left untouched.
+
+    Args:
+        entries: BibTeX entries (mutated in place)
+
+    Returns:
+        The same entries list, for chaining
+    """
+    todo = [i for i, e in enumerate(entries) if "_norm_title" not in e]
+    if not todo:
+        return entries
+
+    titles = [entries[i].get("title", "") for i in todo]
+
+    if len(todo) < MIN_PARALLEL_ENTRIES:
+        normalized = [norm_title(t) for t in titles]
+    else:
+        n_workers = os.cpu_count() or 1
+        chunk_size = (len(titles) + n_workers - 1) // n_workers
+        chunks = [
+            titles[start : start + chunk_size]
+            for start in range(0, len(titles), chunk_size)
+        ]
+        normalized = []
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            for chunk_result in executor.map(_norm_titles_chunk, chunks):
+                normalized.extend(chunk_result)
+
+    for i, norm in zip(todo, normalized):
+        entries[i]["_norm_title"] = norm
+
+    return entries
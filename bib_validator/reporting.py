@@ -17,7 +17,8 @@ def generate_report(
     mismatches = len(results["mismatches"])
     not_found = len(results["not_found"])
 
-    with open(output_file, "w", encoding="utf-8") as f:
+    # Large write buffer so big reports flush in few syscalls
+    with open(output_file, "w", encoding="utf-8", buffering=1 << 20) as f:
         f.write("=" * 80 + "\n")
         f.write("Smart BibTeX Validation Report\n")
         f.write("=" * 80 + "\n\n")
@@ -37,15 +38,19 @@ def generate_report(
             f.write("=" * 80 + "\n\n")
 
             for result in results["mismatches"]:
-                f.write(f"Entry ID: {result['id']}\n")
-                f.write(f"Title: {result['title']}\n")
-                f.write(f"Found via: {result.get('search_method', 'unknown')}\n")
+                parts = [
+                    f"Entry ID: {result['id']}\n",
+                    f"Title: {result['title']}\n",
+                    f"Found via: {result.get('search_method', 'unknown')}\n",
+                ]
                 if result.get("matches"):
-                    f.write(f"Sources matched: {', '.join(result['matches'].keys())}\n")
-                f.write("Issues:\n")
-                for issue in result["issues"]:
-                    f.write(f"  - {issue}\n")
-                f.write("\n")
+                    parts.append(
+                        f"Sources matched: {', '.join(result['matches'].keys())}\n"
+                    )
+                parts.append("Issues:\n")
+                parts.extend(f"  - {issue}\n" for issue in result["issues"])
+                parts.append("\n")
+                f.write("".join(parts))
 
         # Not found
         if results["not_found"]:
@@ -70,18 +75,27 @@ def generate_report(
             f.write("URL REACHABILITY CHECKS\n")
             f.write("=" * 80 + "\n\n")
             
-            unreachable = [r for r in results["url_checks"] if not r["reachable"]]
-            reachable = [r for r in results["url_checks"] if r["reachable"]]
-            
+            # Single pass: keep only the unreachable entries, count the rest
+            unreachable = []
+            reachable_count = 0
+            for r in results["url_checks"]:
+                if r["reachable"]:
+                    reachable_count += 1
+                else:
+                    unreachable.append(r)
+
             f.write(f"Total URLs checked: {len(results['url_checks'])}\n")
-            f.write(f"✓ Reachable: {len(reachable)}\n")
+            f.write(f"✓ Reachable: {reachable_count}\n")
             f.write(f"✗ Unreachable: {len(unreachable)}\n\n")
-            
+
             if unreachable:
                 f.write("Unreachable URLs:\n")
-                for result in unreachable:
-                    f.write(f"  {result['id']}: {result['url']}\n")
-                    f.write(f"    Error: {result['detail']}\n")
+                f.write(
+                    "".join(
+                        f"  {r['id']}: {r['url']}\n    Error: {r['detail']}\n"
+                        for r in unreachable
+                    )
+                )
 
     print(f"✓ Report saved to {output_file}")
 
@@ -1,13 +1,50 @@
 """Base class for validation sources"""
 
-from typing import Dict, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 
 class ValidationSource:
     """Base class for validation sources"""
-    
+
     name: str = "base"
 
+    # Sustained request rate the source tolerates; the validator enforces it
+    # with a per-source token bucket
+    rate_per_sec: float = 1.0
+
+    # Token bucket installed by the validator. The cached decorator acquires
+    # from it only on a cache miss, immediately before the real request, so
+    # cache-served lookups never block on rate limiting.
+    limiter = None
+
+    # Declarative (bibtex_field, source_key, converter) rows processed by
+    # _extract_fields; subclasses override with their own key paths
+    _FIELD_MAP: Tuple[Tuple[str, str, Optional[Callable]], ...] = ()
+
+    def _extract_fields(self, result, get: Optional[Callable] = None) -> Dict:
+        """Apply _FIELD_MAP to a source result in one pass
+
+        Args:
+            result: Source-specific result (dict or object)
+            get: Optional accessor for one key of result; defaults to dict
+                 access for dicts and getattr otherwise
+
+        Returns:
+            Dict of BibTeX field -> value for the non-empty mapped fields
+        """
+        if get is None:
+            if isinstance(result, dict):
+                get = lambda key: result.get(key)  # noqa: E731
+            else:
+                get = lambda key: getattr(result, key, None)  # noqa: E731
+
+        fields = {}
+        for dst, src, fn in self._FIELD_MAP:
+            value = get(src)
+            if value:
+                fields[dst] = fn(value) if fn else value
+        return fields
+
     def should_attempt(self, entry: Dict) -> Tuple[bool, str]:
         """
         Per-source skip logic.
@@ -22,6 +59,19 @@ class ValidationSource:
         """Search for entry by DOI"""
         raise NotImplementedError
 
+    def search_by_doi_batch(self, dois: List[str]) -> Optional[Dict[str, Dict]]:
+        """
+        Resolve many DOIs in one request, if the source supports it.
+
+        Returns:
+            Dict covering every DOI the source definitively answered: the
+            result for a hit, None for a confirmed miss. DOIs absent from
+            the dict were not answered (e.g. the batch request failed) and
+            should be looked up individually. Returns None if the source
+            has no batch endpoint.
+        """
+        return None
+
     def search_by_title(self, title: str) -> Optional[Dict]:
         """Search for entry by title"""
         raise NotImplementedError
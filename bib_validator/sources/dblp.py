@@ -1,80 +1,294 @@
 """DBLP validation source"""
 
+import random
 import requests
+import threading
 import time
 from typing import Dict, Optional, Tuple
+from difflib import SequenceMatcher
+from typing import List
 from .base import ValidationSource
+from ..cache import LookupCache, cached, get_cache
+from ..normalize import norm_title
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    from rapidfuzz import fuzz
+except ImportError:
+    fuzz = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# Transport errors look the same to the retry loop regardless of client.
+# ValueError covers a 200 whose body isn't JSON (CDN/proxy error page,
+# truncated payload): json.JSONDecodeError, orjson.JSONDecodeError and
+# httpx's decode error all subclass it, so such responses are retried
+# rather than crashing the worker
+_REQUEST_ERRORS = (
+    (requests.exceptions.RequestException, httpx.HTTPError, ValueError)
+    if httpx is not None
+    else (requests.exceptions.RequestException, ValueError)
+)
+
+
+# How many hits to request per title query; scoring them locally avoids a
+# fallback query to the next source when DBLP's first hit is a near miss
+TITLE_HITS = 5
+
+# Minimum token_set_ratio (0-100) for a DBLP hit to count as a title match
+TITLE_MATCH_THRESHOLD = 80
+
+# DOIs per batched query; modest chunks keep the GET URI well clear of
+# 414 URI-too-long responses
+DOI_BATCH_CHUNK_SIZE = 25
+
+
+def _title_match_score(query_title: str, hit_title: str) -> float:
+    """Score a DBLP hit title against the queried title on a 0-100 scale"""
+    a, b = norm_title(query_title), norm_title(hit_title)
+    if fuzz is not None:
+        return fuzz.token_set_ratio(a, b)
+    return SequenceMatcher(None, a, b).ratio() * 100.0
+
+
+# Titles containing any of these are not papers DBLP would index
+SKIP_PATTERNS = (
+    "github.com",
+    "github issue",
+    "pull request",
+    "documentation",
+    "readme",
+    "security policy",
+    "vulnerability disclosure",
+    "nasa.gov",
+    "esa.int",
+    "manual",
+    "guide",
+    "tutorial",
+    "blog",
+    "website",
+    "webpage",
+)
+
+
+def _build_skip_automaton():
+    """Build an Aho-Corasick automaton over SKIP_PATTERNS (None if unavailable)"""
+    if ahocorasick is None:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for pattern in SKIP_PATTERNS:
+        automaton.add_word(pattern, pattern)
+    automaton.make_automaton()
+    return automaton
+
+
+# Shared across instances; patterns are fixed at import time
+_SKIP_AUTOMATON = _build_skip_automaton()
+
+# Entry types DBLP is unlikely to index unless the entry carries a DOI
+_SKIP_TYPES_NO_DOI = frozenset({"online", "techreport", "misc", "manual"})
+
+# When any worker sees a 429, all workers hold off until this monotonic
+# deadline instead of retrying in lockstep and getting 429 again
+_rate_gate_lock = threading.Lock()
+_rate_gate_until = 0.0
+
+
+def _set_rate_gate(wait: float) -> None:
+    """Extend the shared backoff deadline by wait seconds from now"""
+    global _rate_gate_until
+    with _rate_gate_lock:
+        _rate_gate_until = max(_rate_gate_until, time.monotonic() + wait)
+
+
+def _wait_for_rate_gate() -> None:
+    """Sleep until the shared backoff deadline has passed"""
+    while True:
+        with _rate_gate_lock:
+            remaining = _rate_gate_until - time.monotonic()
+        if remaining <= 0:
+            return
+        time.sleep(remaining)
 
 
 class DBLPSource(ValidationSource):
     """DBLP validation source"""
-    
+
     name = "dblp"
 
+    rate_per_sec = 2.0
+
+    _FIELD_MAP = (
+        ("title", "title", None),
+        ("year", "year", str),
+        ("venue", "venue", None),
+        ("doi", "doi", None),
+    )
+
+    def __init__(self):
+        # Prefer httpx with HTTP/2: parallel queries multiplex over one
+        # TCP+TLS connection instead of opening one per worker
+        self.session = None
+        if httpx is not None:
+            try:
+                self.session = httpx.Client(
+                    http2=True,
+                    limits=httpx.Limits(max_connections=4, max_keepalive_connections=4),
+                    timeout=15,
+                    headers={"User-Agent": "bib-validator/1.0"},
+                )
+            except ImportError:
+                # httpx installed without the http2 extra (h2 missing)
+                self.session = None
+
+        if self.session is None:
+            # Keep-alive requests session so queries reuse one TLS connection
+            self.session = requests.Session()
+            self.session.headers["User-Agent"] = "bib-validator/1.0"
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=4, pool_maxsize=8, max_retries=0
+            )
+            self.session.mount("https://", adapter)
+
     def should_attempt(self, entry: Dict) -> Tuple[bool, str]:
         """DBLP-specific skip policy"""
         entry_type = entry.get("ENTRYTYPE", "").lower()
         title = (entry.get("title") or "").lower()
+        has_doi = bool(entry.get("doi"))
 
-        skip_patterns = [
-            "github.com",
-            "github issue",
-            "pull request",
-            "documentation",
-            "readme",
-            "security policy",
-            "vulnerability disclosure",
-            "nasa.gov",
-            "esa.int",
-            "manual",
-            "guide",
-            "tutorial",
-            "blog",
-            "website",
-            "webpage",
-        ]
-
-        for pattern in skip_patterns:
-            if pattern in title:
+        # Single linear pass over the title via Aho-Corasick when available,
+        # falling back to one substring scan per pattern
+        if _SKIP_AUTOMATON is not None:
+            for _, pattern in _SKIP_AUTOMATON.iter(title):
                 return False, f"title contains '{pattern}'"
+        else:
+            for pattern in SKIP_PATTERNS:
+                if pattern in title:
+                    return False, f"title contains '{pattern}'"
 
-        if entry_type == "online" and not entry.get("doi"):
-            return False, "online entry without DOI"
-
-        if entry_type in ["techreport", "misc", "manual"] and not entry.get("doi"):
+        if entry_type in _SKIP_TYPES_NO_DOI and not has_doi:
             return False, f"{entry_type} without DOI"
 
         return True, "ok"
 
+    @cached("dblp", "doi")
     def search_by_doi(self, doi: str) -> Optional[Dict]:
         """Search DBLP by DOI"""
         params = {"q": f"doi:{doi}", "format": "json", "h": 1}
         return self._search(params)
 
+    def search_by_doi_batch(self, dois: List[str]) -> Optional[Dict[str, Dict]]:
+        """Resolve several DOIs per query via dblp's OR search syntax
+
+        One 'doi:A|doi:B|...' query replaces a request per DOI. Hits are
+        mapped back by the doi field of each result; DOIs a successful
+        query did not return are recorded as confirmed misses (None). A
+        chunk with no hits at all is left unanswered, since _search_hits
+        returns the same empty list for a failed query, and the validator
+        then retries those DOIs individually.
+        """
+        results: Dict[str, Dict] = {}
+        cache = get_cache()
+
+        for start in range(0, len(dois), DOI_BATCH_CHUNK_SIZE):
+            chunk = dois[start : start + DOI_BATCH_CHUNK_SIZE]
+            query = "|".join(f"doi:{doi}" for doi in chunk)
+            # Batched queries bypass the cached decorator, so pace them
+            # against the source's token bucket here
+            if self.limiter is not None:
+                self.limiter.acquire()
+            hits = self._search_hits(
+                {"q": query, "format": "json", "h": len(chunk)}
+            )
+            if not hits:
+                continue
+
+            by_doi = {}
+            for hit in hits:
+                hit_doi = (hit.get("doi") or "").lower()
+                if hit_doi:
+                    by_doi[hit_doi] = hit
+
+            for doi in chunk:
+                hit = by_doi.get(doi.lower())
+                results[doi] = hit
+                # Seed the per-DOI cache so later runs skip the batch too;
+                # misses get the cache's short negative TTL
+                if cache is not None:
+                    cache.set(LookupCache.make_key("dblp", "doi", doi), hit)
+
+        return results
+
+    @cached("dblp", "title")
     def search_by_title(self, title: str) -> Optional[Dict]:
-        """Search DBLP by title"""
-        params = {"q": title, "format": "json", "h": 1}
-        return self._search(params)
+        """Search DBLP by title, keeping the best of several hits
+
+        Requesting TITLE_HITS candidates and fuzzy-scoring them locally
+        means a near-miss first hit no longer forces a miss (and a fallback
+        query against the next source); the response stays a few KB.
+        """
+        params = {"q": title, "format": "json", "h": TITLE_HITS}
+        hits = self._search_hits(params)
+
+        best = None
+        best_score = 0.0
+        for hit in hits:
+            score = _title_match_score(title, hit.get("title", ""))
+            if score > best_score:
+                best, best_score = hit, score
+
+        if best is not None and best_score >= TITLE_MATCH_THRESHOLD:
+            return best
+        return None
 
     def _search(self, params: Dict, max_retries: int = 3) -> Optional[Dict]:
-        """Search DBLP with exponential backoff retry"""
+        """Search DBLP and return the first hit, if any"""
+        hits = self._search_hits(params, max_retries)
+        return hits[0] if hits else None
+
+    def _search_hits(self, params: Dict, max_retries: int = 3) -> list:
+        """Search DBLP with exponential backoff retry, returning all hits"""
         url = "https://dblp.org/search/publ/api"
         retry_delay = 3
 
         for attempt in range(max_retries):
             try:
-                response = requests.get(url, params=params, timeout=15)
+                _wait_for_rate_gate()
+                response = self.session.get(url, params=params, timeout=15)
 
                 if response.status_code == 429:
                     if attempt < max_retries - 1:
-                        wait_time = retry_delay * (2 ** attempt)
-                        print(f"  ⏳ Rate limited. Waiting {wait_time}s...")
+                        # Honor Retry-After when the server provides it, and
+                        # jitter so parallel workers don't retry in lockstep
+                        try:
+                            wait_time = float(response.headers.get("Retry-After"))
+                        except (TypeError, ValueError):
+                            wait_time = retry_delay * (2 ** attempt)
+                        wait_time += random.uniform(0, 1.0)
+                        _set_rate_gate(wait_time)
+                        print(f"  ⏳ Rate limited. Waiting {wait_time:.1f}s...")
                         time.sleep(wait_time)
                         continue
-                    return None
+                    return []
 
                 response.raise_for_status()
-                data = response.json()
+                if orjson is not None:
+                    data = orjson.loads(response.content)
+                else:
+                    data = response.json()
 
                 if (
                     "result" in data
@@ -83,25 +297,23 @@ class DBLPSource(ValidationSource):
                 ):
                     hits = data["result"]["hits"]["hit"]
                     if hits:
-                        return hits[0]["info"]
+                        return [hit["info"] for hit in hits]
 
-                return None
+                return []
 
-            except requests.exceptions.RequestException:
+            except _REQUEST_ERRORS:
                 if attempt < max_retries - 1:
                     time.sleep(retry_delay * (2 ** attempt))
                     continue
-                return None
+                return []
 
-        return None
+        return []
 
     def extract_bibtex_fields(self, result: Dict) -> Dict:
         """Extract BibTeX fields from DBLP result"""
-        fields = {}
-
-        if "title" in result:
-            fields["title"] = result["title"]
+        fields = self._extract_fields(result)
 
+        # Authors live in a nested structure the flat map can't express
         if "authors" in result and "author" in result["authors"]:
             author_data = result["authors"]["author"]
             if isinstance(author_data, list):
@@ -110,13 +322,4 @@ class DBLPSource(ValidationSource):
                 authors = [author_data["text"] if isinstance(author_data, dict) else author_data]
             fields["author"] = " and ".join(authors)
 
-        if "year" in result:
-            fields["year"] = str(result["year"])
-
-        if "venue" in result:
-            fields["venue"] = result["venue"]
-
-        if "doi" in result:
-            fields["doi"] = result["doi"]
-
         return fields
@@ -1,19 +1,51 @@
 """Google Scholar validation source"""
 
+import logging
+import threading
 from typing import Dict, Optional, Tuple
 from .base import ValidationSource
+from ..cache import cached
 
 try:
-    from scholarly import scholarly
+    from scholarly import scholarly, ProxyGenerator
 except ImportError:
     scholarly = None
+    ProxyGenerator = None
+
+
+logger = logging.getLogger(__name__)
 
 
 class ScholarSource(ValidationSource):
     """Google Scholar validation source"""
-    
+
     name = "scholar"
 
+    # Scholar bans aggressive clients; stay well under one query per second
+    rate_per_sec = 0.2
+
+    _FIELD_MAP = (
+        ("title", "title", None),
+        # Scholar returns authors as a string with 'and' separator
+        ("author", "author", None),
+        ("year", "pub_year", str),
+        ("venue", "venue", None),
+    )
+
+    def __init__(self):
+        # scholarly is fragile under concurrency and Scholar bans bursts;
+        # allow exactly one in-flight query regardless of worker count
+        self._lock = threading.Semaphore(1)
+
+        # Rotate through free proxies to survive Scholar's rate limiting
+        if scholarly is not None and ProxyGenerator is not None:
+            try:
+                pg = ProxyGenerator()
+                if pg.FreeProxies():
+                    scholarly.use_proxy(pg)
+            except Exception:
+                logger.debug("Could not set up Scholar proxies", exc_info=True)
+
     def should_attempt(self, entry: Dict) -> Tuple[bool, str]:
         """Scholar-specific skip policy"""
         if not entry.get("title"):
@@ -24,38 +56,24 @@ class ScholarSource(ValidationSource):
         """Scholar doesn't support DOI search reliably"""
         return None
 
+    @cached("scholar", "title")
     def search_by_title(self, title: str) -> Optional[Dict]:
         """Search Scholar by title"""
         if scholarly is None:
             return None
-        
-        try:
-            search_query = scholarly.search_pubs(title)
-            result = next(search_query, None)
-            return result
-        except Exception:
-            return None
+
+        # Cache hits never reach this point, so only real queries serialize
+        with self._lock:
+            try:
+                search_query = scholarly.search_pubs(title)
+                result = next(search_query, None)
+                return result
+            except Exception:
+                return None
 
     def extract_bibtex_fields(self, result: Dict) -> Dict:
         """Extract BibTeX fields from Scholar result"""
-        fields = {}
-
-        if "bib" not in result:
-            return fields
-
-        bib = result["bib"]
-
-        if "title" in bib:
-            fields["title"] = bib["title"]
-
-        if "author" in bib:
-            # Scholar returns authors as a string with 'and' separator
-            fields["author"] = bib["author"]
-
-        if "pub_year" in bib:
-            fields["year"] = str(bib["pub_year"])
-
-        if "venue" in bib:
-            fields["venue"] = bib["venue"]
-
-        return fields
+        bib = result.get("bib")
+        if not bib:
+            return {}
+        return self._extract_fields(bib)
@@ -1,19 +1,42 @@
 """Semantic Scholar validation source"""
 
-from typing import Dict, Optional, Tuple
+import time
+
+import requests
+from typing import Dict, List, Optional, Tuple
 from .base import ValidationSource
+from ..cache import LookupCache, cached, get_cache
 
 try:
     from semanticscholar import SemanticScholar
 except ImportError:
     SemanticScholar = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+BATCH_URL = "https://api.semanticscholar.org/graph/v1/paper/batch"
+BATCH_FIELDS = "title,authors,year,venue,externalIds"
+# The batch endpoint accepts up to 500 IDs per request
+BATCH_CHUNK_SIZE = 500
+
 
 class SemanticScholarSource(ValidationSource):
     """Semantic Scholar validation source"""
     
     name = "semantic"
 
+    rate_per_sec = 1.0
+
+    _FIELD_MAP = (
+        ("title", "title", None),
+        ("year", "year", str),
+        ("venue", "venue", None),
+    )
+
     def __init__(self):
         if SemanticScholar is None:
             self.sch = None
@@ -26,6 +49,7 @@ class SemanticScholarSource(ValidationSource):
             return False, "missing doi and title"
         return True, "ok"
 
+    @cached("semantic", "doi")
     def search_by_doi(self, doi: str) -> Optional[Dict]:
         """Search Semantic Scholar by DOI"""
         if self.sch is None:
@@ -37,6 +61,83 @@ class SemanticScholarSource(ValidationSource):
         except Exception:
             return None
 
+    def search_by_doi_batch(self, dois: List[str]) -> Optional[Dict[str, Dict]]:
+        """Resolve up to 500 DOIs per request via the paper/batch endpoint
+
+        Only chunks the endpoint actually answered land in the returned
+        dict (with None for confirmed misses); a chunk whose POST fails
+        after retries is left out entirely, so the validator falls back to
+        per-DOI lookups for those DOIs instead of treating a transport
+        failure as "not indexed".
+        """
+        results: Dict[str, Dict] = {}
+        cache = get_cache()
+
+        for start in range(0, len(dois), BATCH_CHUNK_SIZE):
+            chunk = dois[start : start + BATCH_CHUNK_SIZE]
+            # Batched queries bypass the cached decorator, so pace them
+            # against the source's token bucket here
+            if self.limiter is not None:
+                self.limiter.acquire()
+            papers = self._post_batch(chunk)
+            if papers is None:
+                continue
+
+            # The endpoint returns results positionally, null for misses
+            for doi, paper in zip(chunk, papers):
+                results[doi] = paper or None
+                # Seed the per-DOI cache so later runs skip the batch too;
+                # misses get the cache's short negative TTL
+                if cache is not None:
+                    cache.set(
+                        LookupCache.make_key("semantic", "doi", doi), paper or None
+                    )
+
+        return results
+
+    def _post_batch(self, chunk: List[str], max_retries: int = 3) -> Optional[List]:
+        """POST one ID chunk, retrying rate limits and transport errors
+
+        The unauthenticated batch endpoint 429s readily; honor Retry-After
+        when present and back off exponentially otherwise. Returns the
+        positional result list, or None once retries are exhausted.
+        """
+        retry_delay = 3
+
+        for attempt in range(max_retries):
+            try:
+                response = requests.post(
+                    BATCH_URL,
+                    params={"fields": BATCH_FIELDS},
+                    json={"ids": [f"DOI:{doi}" for doi in chunk]},
+                    headers={"User-Agent": "bib-validator/1.0"},
+                    timeout=30,
+                )
+
+                if response.status_code == 429:
+                    if attempt < max_retries - 1:
+                        try:
+                            wait_time = float(response.headers.get("Retry-After"))
+                        except (TypeError, ValueError):
+                            wait_time = retry_delay * (2 ** attempt)
+                        time.sleep(wait_time)
+                        continue
+                    return None
+
+                response.raise_for_status()
+                if orjson is not None:
+                    return orjson.loads(response.content)
+                return response.json()
+
+            except Exception:
+                if attempt < max_retries - 1:
+                    time.sleep(retry_delay * (2 ** attempt))
+                    continue
+                return None
+
+        return None
+
+    @cached("semantic", "title")
     def search_by_title(self, title: str) -> Optional[Dict]:
         """Search Semantic Scholar by title"""
         if self.sch is None:
@@ -51,25 +152,44 @@ class SemanticScholarSource(ValidationSource):
             return None
 
     def extract_bibtex_fields(self, result: Dict) -> Dict:
-        """Extract BibTeX fields from Semantic Scholar result"""
-        fields = {}
+        """Extract BibTeX fields from Semantic Scholar result
 
-        if hasattr(result, "title") and result.title:
-            fields["title"] = result.title
+        Handles both Paper objects from the semanticscholar client and the
+        raw dicts returned by the batch endpoint.
+        """
+        if isinstance(result, dict):
+            fields = self._extract_fields(result)
 
-        if hasattr(result, "authors") and result.authors:
-            authors = [author.name for author in result.authors if hasattr(author, "name")]
+            # Authors and the DOI live in nested structures
+            authors = [
+                a.get("name") for a in result.get("authors") or [] if a.get("name")
+            ]
             if authors:
                 fields["author"] = " and ".join(authors)
 
-        if hasattr(result, "year") and result.year:
-            fields["year"] = str(result.year)
+            external_ids = result.get("externalIds") or {}
+            if external_ids.get("DOI"):
+                fields["doi"] = external_ids["DOI"]
+
+            return fields
+
+        # Paper objects carry the raw API payload; reading it via the dict
+        # path avoids probing every attribute twice through hasattr
+        raw = getattr(result, "raw_data", None)
+        if isinstance(raw, dict):
+            return self.extract_bibtex_fields(raw)
+
+        fields = self._extract_fields(result)
 
-        if hasattr(result, "venue") and result.venue:
-            fields["venue"] = result.venue
+        authors = [
+            getattr(author, "name", None) for author in getattr(result, "authors", None) or []
+        ]
+        authors = [name for name in authors if name]
+        if authors:
+            fields["author"] = " and ".join(authors)
 
-        if hasattr(result, "externalIds") and result.externalIds:
-            if "DOI" in result.externalIds:
-                fields["doi"] = result.externalIds["DOI"]
+        external_ids = getattr(result, "externalIds", None) or {}
+        if external_ids.get("DOI"):
+            fields["doi"] = external_ids["DOI"]
 
         return fields
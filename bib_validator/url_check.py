@@ -1,37 +1,123 @@
 """URL reachability checker for BibTeX entries"""
 
+import asyncio
+import functools
 import logging
+import re
+import socket
 import requests
-from typing import Tuple
+from typing import Dict, List, Tuple
 from urllib.parse import urlparse
 
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from .cache import get_cache
+
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of in-flight URL checks when running concurrently
+CONCURRENCY_LIMIT = 50
+
+# Publisher URLs often bounce through several CDN hops; cap how many we follow
+MAX_REDIRECTS = 3
+
+# identity encoding skips gzip negotiation for responses we never read
+CHECK_HEADERS = {
+    "Accept-Encoding": "identity",
+    "User-Agent": "bib-validator/1.0",
+}
+
+# Hosts whose DNS resolution already failed this run; skip further checks
+# against them instead of paying one timeout per URL
+_failed_hosts = set()
+
+
+@functools.lru_cache(maxsize=1024)
+def _resolve_host(host: str) -> bool:
+    """Resolve a hostname once per run; False if DNS resolution fails"""
+    try:
+        socket.getaddrinfo(host, 443)
+        return True
+    except OSError:
+        return False
+
+
+def _conditional_headers(url: str) -> dict:
+    """Request headers for url, including cache validators from earlier runs
+
+    When a previous run recorded an ETag or Last-Modified for this URL, the
+    server can answer the revalidation with a bodyless 304 Not Modified.
+    """
+    cache = get_cache()
+    if cache is None:
+        return CHECK_HEADERS
+
+    etag, last_modified = cache.get_url_validators(url)
+    if not etag and not last_modified:
+        return CHECK_HEADERS
+
+    headers = dict(CHECK_HEADERS)
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    return headers
+
+
+def _store_validators(url: str, response_headers) -> None:
+    """Record ETag/Last-Modified from a successful response for next run"""
+    etag = response_headers.get("ETag")
+    last_modified = response_headers.get("Last-Modified")
+    if not etag and not last_modified:
+        return
+
+    cache = get_cache()
+    if cache is not None:
+        cache.set_url_validators(url, etag, last_modified)
+
+
+def _host_known_dead(url: str) -> bool:
+    """True if the URL's host already failed DNS resolution this run
+
+    Uses urlparse().hostname, not netloc: netloc keeps the port, userinfo
+    and IPv6 brackets, none of which belong in a getaddrinfo probe (or in
+    the memo set, which the async path and error handlers share).
+    """
+    host = urlparse(url).hostname
+    if not host:
+        return False
+    if host in _failed_hosts:
+        return True
+    if not _resolve_host(host):
+        _failed_hosts.add(host)
+        return True
+    return False
+
+
+# Match doi.org, www.doi.org, dx.doi.org, etc. without allocating a
+# ParseResult per call
+_DOI_HOST_RE = re.compile(r"^https?://(?:[\w-]+\.)*doi\.org(?:/|$)", re.I)
+_HTTP_SCHEME_RE = re.compile(r"^https?://")
+
 
 def is_doi_url(url: str) -> bool:
     """
     Check if URL is a DOI resolver URL (skip reachability checks for these).
-    
+
     DOI URLs like https://doi.org/10.xxxx/... or https://dx.doi.org/... are
     handled via the 'doi' field normalization and don't need separate reachability checks.
-    
+
     Args:
         url: URL string
-    
+
     Returns:
         True if URL is a DOI resolver, False otherwise
     """
-    if not url:
-        return False
-    
-    try:
-        parsed = urlparse(url)
-        netloc = parsed.netloc.lower()
-        # Match doi.org, www.doi.org, dx.doi.org, etc.
-        return "doi.org" in netloc
-    except Exception:
-        return False
+    return bool(url) and bool(_DOI_HOST_RE.match(url))
 
 
 def classify_request_exception(e: Exception) -> str:
@@ -91,27 +177,47 @@ def check_url(url: str, session: requests.Session, timeout: float = 6.0) -> Tupl
         return False, "empty_url"
     
     # Basic scheme validation
-    if not (url.startswith("http://") or url.startswith("https://")):
+    if not _HTTP_SCHEME_RE.match(url):
         return False, "invalid_scheme"
-    
+
+    # Don't pay a timeout per URL on a host that already failed DNS
+    if _host_known_dead(url):
+        return False, "dns"
+
+    session.max_redirects = MAX_REDIRECTS
+    headers = _conditional_headers(url)
+
     # Try HEAD first
     try:
-        response = session.head(url, allow_redirects=True, timeout=timeout)
+        response = session.head(
+            url, allow_redirects=True, timeout=timeout, headers=headers
+        )
         status = response.status_code
-        
-        # Check if status is valid (2xx or 3xx)
+
+        # Check if status is valid (2xx or 3xx; 304 means unchanged since the
+        # validators we sent were recorded, i.e. reachable)
         if 200 <= status < 400:
+            if status != 304:
+                _store_validators(url, response.headers)
             return True, f"HTTP {status}"
-        
+
         # If 405 (Method Not Allowed) or 403 (sometimes servers block HEAD), try GET
         if status in (405, 403):
             logger.debug("HEAD returned %d for %s; trying GET fallback", status, url)
             try:
-                response = session.get(url, allow_redirects=True, timeout=timeout, stream=True)
+                response = session.get(
+                    url,
+                    allow_redirects=True,
+                    timeout=timeout,
+                    stream=True,
+                    headers=headers,
+                )
                 response.close()  # Close immediately without downloading body
-                
+
                 status = response.status_code
                 if 200 <= status < 400:
+                    if status != 304:
+                        _store_validators(url, response.headers)
                     return True, f"HTTP {status}"
                 else:
                     return False, f"HTTP {status}"
@@ -133,6 +239,9 @@ def check_url(url: str, session: requests.Session, timeout: float = 6.0) -> Tupl
         # Classify DNS vs connection error
         if "Name or service not known" in str(e) or "getaddrinfo failed" in str(e):
             logger.debug("URL check DNS error for %s", url, exc_info=True)
+            host = urlparse(url).hostname
+            if host:
+                _failed_hosts.add(host)
             return False, "dns"
         logger.debug("URL check connection error for %s", url, exc_info=True)
         return False, "connection_error"
@@ -142,3 +251,179 @@ def check_url(url: str, session: requests.Session, timeout: float = 6.0) -> Tupl
     except Exception as e:
         logger.debug("URL check unexpected error for %s: %s", url, type(e).__name__, exc_info=True)
         return False, "unknown_error"
+
+
+def classify_aiohttp_exception(e: Exception) -> str:
+    """
+    Classify an aiohttp/asyncio exception into the same short strings
+    classify_request_exception returns.
+
+    Args:
+        e: Exception from aiohttp or asyncio
+
+    Returns:
+        Classification string: "timeout", "dns", "ssl", "connection_error", etc.
+    """
+    if aiohttp is None:
+        return "unknown_error"
+
+    if isinstance(e, asyncio.TimeoutError):
+        return "timeout"
+
+    # ClientConnectorDNSError only exists in newer aiohttp releases
+    dns_error = getattr(aiohttp, "ClientConnectorDNSError", None)
+    if dns_error is not None and isinstance(e, dns_error):
+        return "dns"
+
+    if isinstance(e, aiohttp.ClientSSLError):
+        return "ssl"
+    elif isinstance(e, aiohttp.ClientConnectionError):
+        if "Name or service not known" in str(e) or "getaddrinfo failed" in str(e):
+            return "dns"
+        return "connection_error"
+    elif isinstance(e, aiohttp.ClientError):
+        return "request_error"
+    else:
+        return "unknown_error"
+
+
+async def check_url_async(
+    session, url: str, timeout: float = 6.0, semaphore: "asyncio.Semaphore" = None
+) -> Tuple[bool, str]:
+    """
+    Async variant of check_url using an aiohttp.ClientSession.
+
+    Same strategy as check_url: HEAD first, GET fallback on 403/405,
+    2xx/3xx accepted as reachable.
+
+    Args:
+        session: aiohttp.ClientSession for connection reuse
+        url: URL string to check
+        timeout: HTTP request timeout in seconds (default 6.0)
+        semaphore: Optional asyncio.Semaphore bounding concurrency
+
+    Returns:
+        Tuple (ok: bool, detail: str), same format as check_url
+    """
+    if not url:
+        return False, "empty_url"
+
+    if not _HTTP_SCHEME_RE.match(url):
+        return False, "invalid_scheme"
+
+    # Cheap set lookup only: blocking DNS resolution has no place on the
+    # event loop, and aiohttp caches successful lookups itself
+    if urlparse(url).hostname in _failed_hosts:
+        return False, "dns"
+
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+    # The validator lookup is a local SQLite read; cheap enough off-loop
+    headers = _conditional_headers(url)
+
+    async def _check():
+        try:
+            async with session.head(
+                url,
+                allow_redirects=True,
+                max_redirects=MAX_REDIRECTS,
+                timeout=client_timeout,
+                headers=headers,
+            ) as response:
+                status = response.status
+                response_headers = response.headers
+
+            if 200 <= status < 400:
+                if status != 304:
+                    _store_validators(url, response_headers)
+                return True, f"HTTP {status}"
+
+            # Some servers block HEAD; retry with GET without downloading the body
+            if status in (405, 403):
+                logger.debug("HEAD returned %d for %s; trying GET fallback", status, url)
+                try:
+                    resp = await session.get(
+                        url,
+                        allow_redirects=True,
+                        max_redirects=MAX_REDIRECTS,
+                        timeout=client_timeout,
+                        headers=headers,
+                    )
+                    status = resp.status
+                    response_headers = resp.headers
+                    resp.release()  # Release connection without reading body
+
+                    if 200 <= status < 400:
+                        if status != 304:
+                            _store_validators(url, response_headers)
+                        return True, f"HTTP {status}"
+                    else:
+                        return False, f"HTTP {status}"
+                except Exception as e:
+                    err_class = classify_aiohttp_exception(e)
+                    logger.debug("GET fallback failed for %s: %s", url, err_class, exc_info=True)
+                    return False, err_class
+
+            return False, f"HTTP {status}"
+
+        except Exception as e:
+            err_class = classify_aiohttp_exception(e)
+            if err_class == "dns":
+                host = urlparse(url).hostname
+                if host:
+                    _failed_hosts.add(host)
+            logger.debug("URL check failed for %s: %s", url, err_class, exc_info=True)
+            return False, err_class
+
+    if semaphore is not None:
+        async with semaphore:
+            return await _check()
+    return await _check()
+
+
+async def _check_urls_batch_async(
+    urls: List[str], timeout: float, concurrency: int
+) -> Dict[str, Tuple[bool, str]]:
+    """Run check_url_async over urls under a single session"""
+    connector = aiohttp.TCPConnector(limit=100, ttl_dns_cache=300)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with aiohttp.ClientSession(connector=connector) as session:
+        results = await asyncio.gather(
+            *[check_url_async(session, url, timeout, semaphore) for url in urls]
+        )
+
+    return dict(zip(urls, results))
+
+
+def check_urls_batch(
+    urls: List[str], timeout: float = 6.0, concurrency: int = CONCURRENCY_LIMIT
+) -> Dict[str, Tuple[bool, str]]:
+    """
+    Check many URLs concurrently and return results keyed by URL.
+
+    Uses asyncio + aiohttp so the total wall time is bounded by the slowest
+    URL rather than the sum of all round-trips. Falls back to sequential
+    check_url calls when aiohttp is not installed.
+
+    Args:
+        urls: List of URL strings to check
+        timeout: HTTP request timeout in seconds (default 6.0)
+        concurrency: Maximum number of in-flight requests (default 50)
+
+    Returns:
+        Dict mapping each URL to its (ok, detail) tuple from check_url
+    """
+    # De-duplicate while preserving order
+    unique_urls = list(dict.fromkeys(u for u in urls if u))
+    if not unique_urls:
+        return {}
+
+    if aiohttp is None:
+        logger.debug("aiohttp not available; falling back to sequential URL checks")
+        session = requests.Session()
+        try:
+            return {url: check_url(url, session, timeout) for url in unique_urls}
+        finally:
+            session.close()
+
+    return asyncio.run(_check_urls_batch_async(unique_urls, timeout, concurrency))
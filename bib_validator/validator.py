@@ -1,12 +1,115 @@
 """Core validation logic"""
 
+import functools
+import re
+import string
+import threading
 import time
-import requests
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from difflib import SequenceMatcher
-from typing import Dict, List, Optional, Any
-from copy import deepcopy
+from typing import Dict, Iterator, List, Optional, Any
+from .normalize import annotate_norm_titles, norm_title
 from .sources import ValidationSource, build_sources, DEFAULT_ORDER
-from .url_check import check_url, is_doi_url
+from .url_check import check_urls_batch, is_doi_url
+
+try:
+    from rapidfuzz import fuzz as _rapidfuzz
+except ImportError:
+    _rapidfuzz = None
+
+try:
+    # cdist scores whole author lists in one C call; it needs numpy for
+    # its result matrix, so both gate the matrix path together
+    import numpy as _np
+    from rapidfuzz import process as _rf_process
+except ImportError:
+    _np = None
+    _rf_process = None
+
+try:
+    from tqdm import tqdm
+except ImportError:
+    tqdm = None
+
+
+# Worker threads dispatching (entry, source) lookups
+MAX_WORKERS = 8
+
+# Per-source cap on concurrent requests; scholarly breaks under any concurrency
+SOURCE_CONCURRENCY = {
+    "dblp": 4,
+    "scholar": 1,
+    "semantic": 4,
+}
+
+# Normalized titles at least this similar (0-100) are treated as duplicates
+DUPLICATE_TITLE_RATIO = 90
+
+# LaTeX commands are the one pattern that genuinely needs the regex engine;
+# brace and punctuation stripping are single C-level scans via str.translate
+_RE_LATEX = re.compile(r"\\[a-zA-Z]+\{([^}]*)\}")
+_RE_NONWORD = re.compile(r"[^\w\s]")
+_BRACE_TABLE = str.maketrans("", "", "{}")
+# Underscore is a word character under \w, so the regex kept it; match that
+_PUNCT_TABLE = str.maketrans({c: " " for c in string.punctuation if c != "_"})
+
+
+@functools.lru_cache(maxsize=4096)
+def normalize_string(s: str) -> str:
+    """Normalize string for comparison
+
+    Memoized: the same titles, authors and venues are normalized repeatedly
+    (once per source comparison), so repeat calls are dict lookups.
+    """
+    if not s:
+        return ""
+    s = _RE_LATEX.sub(r"\1", s)
+    s = s.lower().translate(_BRACE_TABLE)
+    if s.isascii():
+        s = s.translate(_PUNCT_TABLE)
+    else:
+        # The translate table only covers ASCII punctuation; keep the regex
+        # for the rare accented/unicode string so output is unchanged
+        s = _RE_NONWORD.sub(" ", s)
+    return " ".join(s.split())
+
+
+def _title_ratio(a: str, b: str) -> float:
+    """Similarity of two normalized titles on a 0-100 scale"""
+    if _rapidfuzz is not None:
+        return _rapidfuzz.ratio(a, b)
+    return SequenceMatcher(None, a, b).ratio() * 100.0
+
+
+class TokenBucket:
+    """Thread-safe token bucket allowing `rate` acquisitions per second
+
+    Unlike a fixed sleep, acquire only blocks when the sustained rate would
+    actually be exceeded, so bursts after idle periods go through instantly.
+    """
+
+    def __init__(self, rate: float, burst: float = 1.0):
+        self.rate = rate
+        self.capacity = max(burst, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait = (1.0 - self._tokens) / self.rate
+            time.sleep(wait)
 
 
 def authors_to_list(authors_val: Any) -> List[str]:
@@ -18,11 +121,40 @@ def authors_to_list(authors_val: Any) -> List[str]:
     return [a.strip() for a in str(authors_val).split(" and ") if a.strip()]
 
 
+@dataclass
+class _EntryContext:
+    """Comparison-relevant fields of one entry, derived once
+
+    Built per entry and shared across all of its source comparisons, so
+    the dict lookups, author-list splitting and normalization happen a
+    single time instead of once per matching source.
+    """
+
+    authors: List[str]
+    title: str
+    venue: str
+    year: str
+    has_author: bool
+    has_title: bool
+    norm_authors: List[str]
+    norm_title: str
+    norm_venue: str
+
+
 class SmartBibtexValidator:
     """Validates BibTeX entries against multiple academic sources"""
 
+    # Similarity floors below which a field comparison becomes an issue
+    AUTHOR_THRESHOLD = 0.75
+    VENUE_THRESHOLD = 0.6
+    TITLE_THRESHOLD = 0.85
+
     def __init__(
-        self, entries: List[Dict], sources: Optional[Dict[str, ValidationSource]] = None
+        self,
+        entries: List[Dict],
+        sources: Optional[Dict[str, ValidationSource]] = None,
+        fast_path: bool = True,
+        verbose: bool = False,
     ):
         """
         Initialize validator
@@ -30,20 +162,66 @@ class SmartBibtexValidator:
         Args:
             entries: List of BibTeX entries to validate
             sources: Dict of source_name -> ValidationSource. If None, all defaults used.
+            fast_path: Stop querying further sources once the highest-priority
+                source returns a match with no issues (default: True)
+            verbose: Print one line per entry plus its issues as they are
+                found; the default shows a progress bar and a final summary
+                (issues still land in the report)
         """
         self.entries = entries
         self.sources = sources or build_sources(DEFAULT_ORDER)
-        self.results = {
-            "validated": [],
-            "mismatches": [],
-            "not_found": [],
-            "url_checks": [],
+        self.fast_path = fast_path
+        self.verbose = verbose
+        self.validated: List[Dict] = []
+        self.mismatches: List[Dict] = []
+        self.not_found: List[Dict] = []
+        self.url_checks: List[Dict] = []
+        # Entry ID -> result, filled as results are classified, so
+        # apply_corrections_to_entries never rescans the result lists
+        self._results_by_id: Dict[str, Dict] = {}
+        # Cap concurrent requests per source so rate limits are respected
+        self._source_semaphores = {
+            name: threading.Semaphore(SOURCE_CONCURRENCY.get(name, 1))
+            for name in self.sources
+        }
+        # Token bucket per source enforcing its sustained request rate,
+        # installed on the source so cached lookups acquire only on a miss
+        self._limiters = {
+            name: TokenBucket(source.rate_per_sec)
+            for name, source in self.sources.items()
+        }
+        for name, source in self.sources.items():
+            source.limiter = self._limiters[name]
+        # Batch-prefetched DOI matches: source_name -> {doi: result}
+        self._doi_cache: Dict[str, Dict[str, Dict]] = {}
+
+    @property
+    def results(self) -> Dict[str, List[Dict]]:
+        """Dict view over the result lists, kept for backward compatibility
+
+        The returned lists are the live ones, so existing callers that read
+        (or append to) results["validated"] etc. keep working.
+        """
+        return {
+            "validated": self.validated,
+            "mismatches": self.mismatches,
+            "not_found": self.not_found,
+            "url_checks": self.url_checks,
         }
-        self.session = requests.Session()  # Reuse connection for URL checks
+
+    def _record_result(self, result: Dict) -> None:
+        """File a result in its status list and the by-ID index"""
+        if result["status"] == "validated":
+            self.validated.append(result)
+        elif result["status"] == "mismatch":
+            self.mismatches.append(result)
+        elif result["status"] == "not_found":
+            self.not_found.append(result)
+        self._results_by_id[result["id"]] = result
 
     def validate_all(self, check_urls: bool = True):
         """Validate all entries against sources
-        
+
         Args:
             check_urls: Whether to check URL reachability (default: True)
         """
@@ -52,96 +230,281 @@ class SmartBibtexValidator:
             return
 
         print("🔍 Starting validation against multiple sources...")
-        print(f"⏱ Estimated time: ~{len(self.entries) * 3 // 60} minutes")
+        print(f"⚙ Dispatching lookups across {MAX_WORKERS} workers")
         print()
 
+        # Normalize each title once up front instead of once per source
+        # (no-op when cli.main already annotated the entries); underscore-
+        # prefixed keys are stripped before entries are written back
+        annotate_norm_titles(self.entries)
+
+        # Cluster near-duplicate titles so each cluster is looked up once
+        representatives = self._assign_clusters()
+        cluster_members: Dict[int, List[int]] = {}
+        for idx, entry in enumerate(self.entries):
+            cluster_members.setdefault(entry["_cluster_id"], []).append(idx)
+
         total = len(self.entries)
-        for idx, entry in enumerate(self.entries, 1):
-            entry_id = entry.get("ID", "unknown")
-            title = entry.get("title", "No title")[:50]
-
-            print(f"[{idx}/{total}] {entry_id}: {title}...", end=" ")
-
-            result = self.validate_entry(entry)
-
-            if result["status"] == "validated":
-                print("✓")
-                self.results["validated"].append(result)
-            elif result["status"] == "mismatch":
-                print("⚠")
-                for issue in result["issues"]:
-                    print(f"    {issue}")
-                self.results["mismatches"].append(result)
-            elif result["status"] == "not_found":
-                print("✗")
-                self.results["not_found"].append(result)
-
-            # Delay between entries
-            time.sleep(2)
-        
+        if len(representatives) < total:
+            print(
+                f"🔁 {total - len(representatives)} duplicate titles will reuse lookups"
+            )
+
+        # Resolve DOIs in bulk first for sources with a batch endpoint
+        self._prefetch_doi_matches()
+
+        # One work item per (cluster representative, source); per-source
+        # semaphores bound concurrency so rate limits are still respected
+        n_sources = sum(1 for s in DEFAULT_ORDER if s in self.sources)
+        matches_per_cluster: Dict[int, Dict] = {c: {} for c in representatives}
+        attempts_per_cluster: Dict[int, Dict] = {c: {} for c in representatives}
+        pending = {c: n_sources for c in representatives}
+
+        # A progress bar redraws one line per entry instead of the 1-4
+        # print calls of verbose mode; on cache-served runs the per-entry
+        # stdout writes would otherwise dominate wall time
+        progress = None
+        if tqdm is not None and not self.verbose:
+            progress = tqdm(total=total, desc="Validating", unit="entry")
+
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            future_to_item = {}
+            for cluster_id, rep_idx in representatives.items():
+                entry = self.entries[rep_idx]
+                for source_name in DEFAULT_ORDER:
+                    if source_name not in self.sources:
+                        continue
+                    future = executor.submit(self._query_source, source_name, entry)
+                    future_to_item[future] = (cluster_id, source_name)
+
+            done_entries = 0
+
+            for future in as_completed(future_to_item):
+                cluster_id, source_name = future_to_item[future]
+                match, attempt = future.result()
+
+                attempts_per_cluster[cluster_id][source_name] = attempt
+                if match is not None:
+                    matches_per_cluster[cluster_id][source_name] = match
+
+                pending[cluster_id] -= 1
+                if pending[cluster_id] > 0:
+                    continue
+
+                # Cluster done: every member reuses the shared matches but is
+                # compared against its own fields
+                for idx in cluster_members[cluster_id]:
+                    done_entries += 1
+                    entry = self.entries[idx]
+                    result = self._assemble_result(
+                        entry,
+                        matches_per_cluster[cluster_id],
+                        attempts_per_cluster[cluster_id],
+                    )
+
+                    self._record_result(result)
+
+                    if progress is not None:
+                        progress.update(1)
+                    elif self.verbose:
+                        entry_id = entry.get("ID", "unknown")
+                        title = entry.get("title", "No title")[:50]
+                        mark = {"validated": "✓", "mismatch": "⚠", "not_found": "✗"}[
+                            result["status"]
+                        ]
+                        print(f"[{done_entries}/{total}] {entry_id}: {title}... {mark}")
+                        for issue in result["issues"]:
+                            print(f"    {issue}")
+
+        if progress is not None:
+            progress.close()
+
+        print(
+            f"\n✓ {len(self.validated)} validated, "
+            f"⚠ {len(self.mismatches)} mismatches, "
+            f"✗ {len(self.not_found)} not found"
+        )
+
         # Check URLs if requested
         if check_urls:
             print("\n🔗 Checking URL reachability...")
             self.check_all_urls()
 
-    def validate_entry(self, entry: Dict) -> Dict:
-        """Validate single entry against all sources in order"""
-        result = {
-            "id": entry.get("ID", "unknown"),
-            "title": entry.get("title", ""),
-            "status": "unknown",
-            "issues": [],
-            "corrected_fields": {},
-            "search_method": None,
-            "matches": {},
-            "attempts": {},
-        }
+    def _assign_clusters(self) -> Dict[int, int]:
+        """Group entries whose normalized titles are near-duplicates
 
-        # Try each source in order
-        for source_name in DEFAULT_ORDER:
-            if source_name not in self.sources:
-                continue
+        Sorts entries by normalized title and merges neighbours whose
+        similarity is at least DUPLICATE_TITLE_RATIO, so merged .bib files
+        with repeated papers trigger one lookup per cluster instead of one
+        per entry. Annotates each entry with _cluster_id.
 
-            source = self.sources[source_name]
+        Returns:
+            Dict of cluster_id -> index of the cluster's representative entry
+        """
+        representatives: Dict[int, int] = {}
+        order = sorted(
+            range(len(self.entries)),
+            key=lambda i: self.entries[i].get("_norm_title", ""),
+        )
+
+        next_id = 0
+        prev_idx = None
+        for idx in order:
+            title = self.entries[idx].get("_norm_title", "")
+            if (
+                prev_idx is not None
+                and title
+                and _title_ratio(title, self.entries[prev_idx].get("_norm_title", ""))
+                >= DUPLICATE_TITLE_RATIO
+            ):
+                self.entries[idx]["_cluster_id"] = self.entries[prev_idx]["_cluster_id"]
+            else:
+                self.entries[idx]["_cluster_id"] = next_id
+                representatives[next_id] = idx
+                next_id += 1
+            prev_idx = idx
 
-            # Check if source wants to attempt this entry
-            can_try, why = source.should_attempt(entry)
-            result["attempts"][source_name] = {
-                "attempted": bool(can_try),
-                "reason": why,
-            }
+        return representatives
 
-            if not can_try:
+    def _prefetch_doi_matches(self):
+        """Batch-resolve entry DOIs for sources that support it
+
+        Populates self._doi_cache so _query_source can answer DOI lookups
+        without a per-entry request. Sources whose search_by_doi_batch
+        returns None have no batch endpoint and are queried per entry.
+        """
+        for source_name, source in self.sources.items():
+            dois = []
+            seen = set()
+            for entry in self.entries:
+                doi = entry.get("doi")
+                if not doi or doi in seen:
+                    continue
+                can_try, _ = source.should_attempt(entry)
+                if can_try:
+                    seen.add(doi)
+                    dois.append(doi)
+
+            if not dois:
                 continue
 
+            prefetched = source.search_by_doi_batch(dois)
+            if prefetched is None:
+                continue
+
+            resolved = sum(1 for hit in prefetched.values() if hit is not None)
+            msg = f"📦 {source_name}: batch-resolved {resolved}/{len(dois)} DOIs"
+            unanswered = len(dois) - len(prefetched)
+            if unanswered:
+                msg += f" ({unanswered} unanswered, will be looked up individually)"
+            print(msg)
+            self._doi_cache[source_name] = prefetched
+
+    def _query_source(self, source_name: str, entry: Dict):
+        """Query one source for one entry (runs on a worker thread)
+
+        Returns:
+            Tuple (match, attempt): match is the per-source match dict or None,
+            attempt is the should_attempt bookkeeping dict.
+        """
+        source = self.sources[source_name]
+
+        # Check if source wants to attempt this entry
+        can_try, why = source.should_attempt(entry)
+        attempt = {"attempted": bool(can_try), "reason": why}
+
+        if not can_try:
+            return None, attempt
+
+        with self._source_semaphores[source_name]:
             found = None
             search_method = None
 
-            # Try DOI first if available
+            # Try DOI first if available. The prefetch pass answers a DOI
+            # with a hit or a confirmed miss (None); a DOI absent from the
+            # batch dict means its chunk went unanswered (or the source has
+            # no batch endpoint), so it is looked up individually. Rate
+            # limiting happens inside the cached lookup, only when a real
+            # request goes out
             doi = entry.get("doi")
             if doi:
-                found = source.search_by_doi(doi)
+                batch = self._doi_cache.get(source_name)
+                if batch is not None and doi in batch:
+                    found = batch[doi]
+                else:
+                    found = source.search_by_doi(doi)
                 if found:
                     search_method = f"{source_name}:DOI"
 
-            # Try title if DOI search didn't work
+            # Try title if DOI search didn't work; search with the normalized
+            # title (raw title is kept for display and comparison)
             if not found:
-                title = entry.get("title")
+                title = entry.get("_norm_title") or norm_title(entry.get("title", ""))
                 if title:
                     found = source.search_by_title(title)
                     if found:
                         search_method = f"{source_name}:Title"
 
-            if found:
-                corrected_fields = source.extract_bibtex_fields(found)
-                result["matches"][source_name] = {
-                    "search_method": search_method,
-                    "source_data": found,
-                    "corrected_fields": corrected_fields,
+        if not found:
+            return None, attempt
+
+        return {
+            "search_method": search_method,
+            "source_data": found,
+            "corrected_fields": source.extract_bibtex_fields(found),
+        }, attempt
+
+    def validate_entry(self, entry: Dict) -> Dict:
+        """Validate single entry against all sources
+
+        With fast_path enabled the highest-priority source is probed alone
+        first: a match with no issues settles the entry with a single
+        lookup. Any sources still to query are independent network calls,
+        so they run concurrently and the entry costs the slowest lookup
+        rather than the sum; results are collected in DEFAULT_ORDER so the
+        preferred-source selection is unchanged.
+        """
+        matches = {}
+        attempts = {}
+        order = [name for name in DEFAULT_ORDER if name in self.sources]
+
+        if self.fast_path and order:
+            primary = order[0]
+            match, attempt = self._query_source(primary, entry)
+            attempts[primary] = attempt
+            if match is not None:
+                matches[primary] = match
+                ctx = self._entry_context(entry)
+                if not self.compare_with_corrected(ctx, match["corrected_fields"]):
+                    return self._assemble_result(entry, matches, attempts)
+            order = order[1:]
+
+        if order:
+            with ThreadPoolExecutor(max_workers=len(order)) as executor:
+                futures = {
+                    name: executor.submit(self._query_source, name, entry)
+                    for name in order
                 }
+                for name in order:
+                    match, attempt = futures[name].result()
+                    attempts[name] = attempt
+                    if match is not None:
+                        matches[name] = match
+
+        return self._assemble_result(entry, matches, attempts)
 
-            # Rate limiting between sources
-            time.sleep(1)
+    def _assemble_result(self, entry: Dict, matches: Dict, attempts: Dict) -> Dict:
+        """Combine per-source matches into a validation result for one entry"""
+        result = {
+            "id": entry.get("ID", "unknown"),
+            "title": entry.get("title", ""),
+            "status": "unknown",
+            "issues": [],
+            "corrected_fields": {},
+            "search_method": None,
+            "matches": matches,
+            "attempts": attempts,
+        }
 
         # Determine status and collect issues
         if not result["matches"]:
@@ -149,102 +512,206 @@ class SmartBibtexValidator:
             result["issues"].append("Entry not found in any source")
             return result
 
-        # Choose corrected fields with priority: dblp -> scholar -> semantic
-        for preferred in DEFAULT_ORDER:
-            if preferred in result["matches"]:
-                result["corrected_fields"] = result["matches"][preferred][
-                    "corrected_fields"
-                ]
-                result["search_method"] = result["matches"][preferred]["search_method"]
-                break
-
-        # Compare against each source match; prefix issues with source name
+        # One ordered pass over the matches: the first source in priority
+        # order (dblp -> scholar -> semantic) supplies the corrected fields,
+        # and every match contributes prefixed issues, deduplicated inline.
+        # The entry's fields are extracted and normalized once, not once
+        # per matching source
+        ctx = self._entry_context(entry)
         issues = []
-        for source_name, m in result["matches"].items():
-            source_issues = self.compare_with_corrected(entry, m["corrected_fields"])
-            issues.extend([f"{source_name.upper()}: {i}" for i in source_issues])
-
-        # De-duplicate issues while preserving order
-        issues = list(dict.fromkeys(issues))
+        seen = set()
+        chose = False
+        for source_name in DEFAULT_ORDER:
+            m = result["matches"].get(source_name)
+            if m is None:
+                continue
+            if not chose:
+                result["corrected_fields"] = m["corrected_fields"]
+                result["search_method"] = m["search_method"]
+                chose = True
+            for i in self.compare_with_corrected(ctx, m["corrected_fields"]):
+                issue = f"{source_name.upper()}: {i}"
+                if issue not in seen:
+                    seen.add(issue)
+                    issues.append(issue)
 
         result["issues"] = issues
         result["status"] = "validated" if not issues else "mismatch"
         return result
 
     def normalize_string(self, s: str) -> str:
-        """Normalize string for comparison"""
-        import re
-
-        if not s:
-            return ""
-        s = re.sub(r"\\[a-zA-Z]+\{([^}]*)\}", r"\1", s)
-        s = re.sub(r"[{}]", "", s)
-        s = re.sub(r"[^\w\s]", " ", s.lower())
-        s = " ".join(s.split())
-        return s
+        """Normalize string for comparison (memoized module-level helper)"""
+        return normalize_string(s)
 
     def similarity(self, a: str, b: str) -> float:
-        """Calculate similarity ratio"""
-        return SequenceMatcher(
-            None, self.normalize_string(a), self.normalize_string(b)
-        ).ratio()
+        """Calculate similarity ratio
 
-    def compare_with_corrected(self, original: Dict, corrected: Dict) -> List[str]:
-        """Compare original entry with corrected fields from validation source"""
+        Uses rapidfuzz's C++ Indel ratio when installed; it tracks
+        SequenceMatcher.ratio closely on bibliographic strings while being
+        orders of magnitude faster. Falls back to difflib otherwise.
+        """
+        na, nb = normalize_string(a), normalize_string(b)
+        # Exact matches after normalization are the common case for
+        # validated entries; don't run the matcher just to learn that
+        if na == nb:
+            return 1.0
+        if not na or not nb:
+            return 0.0
+        if _rapidfuzz is not None:
+            return _rapidfuzz.ratio(na, nb) / 100.0
+        return SequenceMatcher(None, na, nb).ratio()
+
+    @staticmethod
+    def _norm_similarity(na: str, nb: str, threshold: float) -> float:
+        """Similarity of normalized strings, short-circuited for thresholds
+
+        Equal strings return 1.0 without running the matcher. Both
+        rapidfuzz.ratio and SequenceMatcher.ratio normalize by the summed
+        lengths, so the ratio of strings differing in length is bounded
+        above by 2*min(la,lb)/(la+lb) = 1 - |la-lb|/(la+lb); when that
+        bound is already below threshold, return it and skip the O(n*m)
+        matcher entirely.
+        """
+        if na == nb:
+            return 1.0
+        if not na or not nb:
+            return 0.0
+
+        la, lb = len(na), len(nb)
+        upper = 1.0 - abs(la - lb) / (la + lb)
+        if upper < threshold:
+            return upper
+
+        if _rapidfuzz is not None:
+            return _rapidfuzz.ratio(na, nb) / 100.0
+        return SequenceMatcher(None, na, nb).ratio()
+
+    def _entry_context(self, entry: Dict) -> _EntryContext:
+        """Build an entry's comparison context (raw and normalized fields)"""
+        authors = authors_to_list(entry.get("author"))
+        title = entry.get("title", "")
+        venue = entry.get("booktitle") or entry.get("journal") or ""
+        return _EntryContext(
+            authors=authors,
+            title=title,
+            venue=venue,
+            year=entry.get("year", ""),
+            has_author="author" in entry,
+            has_title="title" in entry,
+            norm_authors=[normalize_string(a) for a in authors],
+            norm_title=normalize_string(title),
+            norm_venue=normalize_string(venue),
+        )
+
+    def _author_mismatches(
+        self, corr_authors: List[str], orig_norm_authors: List[str]
+    ) -> List[int]:
+        """Indices of author pairs whose similarity falls below AUTHOR_THRESHOLD
+
+        With rapidfuzz installed, one process.cdist call scores every
+        original author against every corrected author in C. The diagonal
+        covers the positional pairing; when a row's best score sits off the
+        diagonal, the lists merely order authors differently (common with
+        Semantic Scholar), which is not a mismatch. Falls back to the
+        pairwise Python loop otherwise.
+        """
+        corr_norm = [normalize_string(a) for a in corr_authors]
+
+        if _rf_process is not None:
+            cutoff = self.AUTHOR_THRESHOLD * 100
+            scores = _rf_process.cdist(
+                orig_norm_authors, corr_norm, scorer=_rapidfuzz.ratio, dtype=_np.uint8
+            )
+            mismatched = []
+            for i, row in enumerate(scores):
+                if row[i] >= cutoff or row.max() >= cutoff:
+                    continue
+                mismatched.append(i)
+            return mismatched
+
+        return [
+            i
+            for i, (na, ca) in enumerate(zip(orig_norm_authors, corr_norm))
+            if self._norm_similarity(na, ca, self.AUTHOR_THRESHOLD)
+            < self.AUTHOR_THRESHOLD
+        ]
+
+    def compare_with_corrected(self, ctx: _EntryContext, corrected: Dict) -> List[str]:
+        """Compare an entry against corrected fields from a validation source
+
+        Args:
+            ctx: Per-entry context from _entry_context, built once and shared
+                across every source the entry is compared against
+            corrected: Corrected fields from a validation source
+        """
         issues = []
 
         # Compare authors
-        if "author" in corrected and "author" in original:
-            orig_authors = authors_to_list(original.get("author"))
+        if "author" in corrected and ctx.has_author:
             corr_authors = authors_to_list(corrected.get("author"))
 
-            if len(orig_authors) != len(corr_authors):
+            if len(ctx.authors) != len(corr_authors):
                 issues.append(
-                    f"AUTHORS: Different count ({len(orig_authors)} vs {len(corr_authors)})"
+                    f"AUTHORS: Different count ({len(ctx.authors)} vs {len(corr_authors)})"
                 )
             else:
-                mismatches = []
-                for oa, ca in zip(orig_authors, corr_authors):
-                    if self.similarity(oa, ca) < 0.75:
-                        mismatches.append(f"'{oa}' vs '{ca}'")
-                if mismatches and len(mismatches) <= 3:
-                    issues.append(f"AUTHORS: {'; '.join(mismatches)}")
+                mismatched = self._author_mismatches(corr_authors, ctx.norm_authors)
+                if mismatched and len(mismatched) <= 3:
+                    issues.append(
+                        "AUTHORS: "
+                        + "; ".join(
+                            f"'{ctx.authors[i]}' vs '{corr_authors[i]}'"
+                            for i in mismatched
+                        )
+                    )
 
         # Compare venue
-        orig_venue = original.get("booktitle") or original.get("journal") or ""
         corr_venue = corrected.get("venue", "")
-        if orig_venue and corr_venue:
-            if self.similarity(orig_venue, corr_venue) < 0.6:
-                issues.append(f"VENUE: '{orig_venue}' vs '{corr_venue}'")
+        if ctx.venue and corr_venue:
+            if (
+                self._norm_similarity(
+                    ctx.norm_venue, normalize_string(corr_venue), self.VENUE_THRESHOLD
+                )
+                < self.VENUE_THRESHOLD
+            ):
+                issues.append(f"VENUE: '{ctx.venue}' vs '{corr_venue}'")
 
         # Compare year
-        orig_year = original.get("year", "")
         corr_year = corrected.get("year", "")
-        if orig_year and corr_year and orig_year != corr_year:
-            issues.append(f"YEAR: {orig_year} vs {corr_year}")
+        if ctx.year and corr_year and ctx.year != corr_year:
+            issues.append(f"YEAR: {ctx.year} vs {corr_year}")
 
         # Compare title
-        if "title" in original and "title" in corrected:
-            sim = self.similarity(original["title"], corrected["title"])
-            if sim < 0.85:
+        if ctx.has_title and "title" in corrected:
+            sim = self._norm_similarity(
+                ctx.norm_title, normalize_string(corrected["title"]), self.TITLE_THRESHOLD
+            )
+            if sim < self.TITLE_THRESHOLD:
                 issues.append(f"TITLE: Low similarity ({sim:.2f})")
 
         return issues
 
-    def apply_corrections_to_entries(self) -> List[Dict]:
-        """Apply corrected fields to entries and return updated copy"""
-        updated_entries = []
+    def iter_corrected_entries(self) -> Iterator[Dict]:
+        """Yield a corrected copy of each entry, one at a time
 
+        Streaming keeps peak memory at one extra entry instead of a full
+        second entry list; callers that need a list can use
+        apply_corrections_to_entries.
+        """
         for entry in self.entries:
-            entry_copy = deepcopy(entry)
+            # Drop internal annotations (e.g. _norm_title) from the output;
+            # entries are flat str->str dicts, so a shallow copy is enough.
+            # The one occasionally-mutable field is an author list: copy it
+            # so the returned entries never alias the original's container
+            entry_copy = {k: v for k, v in entry.items() if not k.startswith("_")}
+            if isinstance(entry_copy.get("author"), list):
+                entry_copy["author"] = list(entry_copy["author"])
             entry_id = entry.get("ID")
 
-            # Find validation result for this entry
-            validation_result = None
-            for result in self.results["validated"] + self.results["mismatches"]:
-                if result["id"] == entry_id:
-                    validation_result = result
-                    break
+            # Not-found results carry no corrections and get no note
+            validation_result = self._results_by_id.get(entry_id)
+            if validation_result is not None and validation_result["status"] == "not_found":
+                validation_result = None
 
             # Apply corrections if validated or has mismatches
             if validation_result and "corrected_fields" in validation_result:
@@ -270,46 +737,44 @@ class SmartBibtexValidator:
                     else validation_note
                 )
 
-            updated_entries.append(entry_copy)
+            yield entry_copy
 
-        return updated_entries
+    def apply_corrections_to_entries(self) -> List[Dict]:
+        """Apply corrected fields to entries and return updated copy"""
+        return list(self.iter_corrected_entries())
 
     def check_all_urls(self):
         """Check reachability of all URLs in entries"""
-        url_results = []
-        
+        # Collect URLs worth checking (skip DOI resolver URLs)
+        to_check = []
         for entry in self.entries:
-            entry_id = entry.get("ID", "unknown")
             url = entry.get("url", "")
-            
-            if not url:
-                continue
-            
-            # Skip DOI resolver URLs
-            if is_doi_url(url):
-                continue
-            
-            print(f"  Checking URL for {entry_id}...", end=" ")
-            ok, detail = check_url(url, self.session, timeout=6.0)
-            
-            url_result = {
+            if url and not is_doi_url(url):
+                to_check.append((entry.get("ID", "unknown"), url))
+
+        if not to_check:
+            self.url_checks = []
+            return
+
+        # Check all URLs concurrently in one batch
+        print(f"  Checking {len(to_check)} URLs concurrently...")
+        batch_results = check_urls_batch([url for _, url in to_check], timeout=6.0)
+
+        url_results = []
+        for entry_id, url in to_check:
+            ok, detail = batch_results[url]
+
+            url_results.append({
                 "id": entry_id,
                 "url": url,
                 "reachable": ok,
                 "detail": detail,
-            }
-            
-            url_results.append(url_result)
-            
-            if ok:
-                print(f"✓ {detail}")
-            else:
-                print(f"✗ {detail}")
-            
-            # Small delay between URL checks
-            time.sleep(0.5)
-        
-        self.results["url_checks"] = url_results
+            })
+
+            status_mark = "✓" if ok else "✗"
+            print(f"  {status_mark} {entry_id}: {detail}")
+
+        self.url_checks = url_results
         
         # Print summary
         if url_results: